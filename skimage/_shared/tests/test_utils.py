@@ -280,6 +280,32 @@ def test_decorated_channel_axis_shape(channel_axis):
         assert size == x.shape[channel_axis]
 
 
+@channel_as_last_axis(channel_kwarg_names=('out',))
+def _decorated_channel_axis_out(x, *, channel_axis=None, out=None):
+    assert channel_axis == -1
+    if out is None:
+        return x + 1
+    assert out.shape == x.shape
+    out[...] = x + 1
+    return out
+
+
+@testing.parametrize('channel_axis', [0, 1, 2, -1, -2, -3])
+def test_decorated_channel_axis_kwarg(channel_axis):
+    x = np.arange(24).reshape((2, 3, 4))
+
+    # keyword arguments that are None are passed through unchanged
+    result = _decorated_channel_axis_out(x, channel_axis=channel_axis)
+    testing.assert_array_equal(result, x + 1)
+
+    # a returned keyword array is the caller's array, not the moved view
+    out = np.empty_like(x)
+    result = _decorated_channel_axis_out(x, channel_axis=channel_axis,
+                                         out=out)
+    assert result is out
+    testing.assert_array_equal(out, x + 1)
+
+
 def test_decorator_warnings():
     """Assert that warning message issued by decorator points to
     expected file and line number.
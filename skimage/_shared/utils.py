@@ -369,7 +369,10 @@ class channel_as_last_axis:
         first argument to the function is a multichannel array.
     channel_kwarg_names : tuple of str, optional
         A tuple containing the names of any keyword arguments corresponding to
-        multichannel arrays.
+        multichannel arrays. Keyword arguments that are omitted or None are
+        passed through unchanged. If the function returns one of these
+        (moved) arrays, e.g. an ``out`` buffer, the caller's original array
+        is returned instead of the moved view.
     multichannel_output : bool, optional
         A boolean that should be True if the output of the function is not a
         multichannel array and False otherwise. This decorator does not
@@ -416,8 +419,15 @@ class channel_as_last_axis:
             else:
                 new_args = args
 
+            # (moved view, original) pairs, so that a function returning one
+            # of its array keyword arguments (e.g. an ``out`` buffer) hands
+            # the caller's array back rather than the moved view
+            moved_kwargs = []
             for name in self.kwarg_names:
-                kwargs[name] = np.moveaxis(kwargs[name], channel_axis[0], -1)
+                if kwargs.get(name) is not None:
+                    original = kwargs[name]
+                    kwargs[name] = np.moveaxis(original, channel_axis[0], -1)
+                    moved_kwargs.append((kwargs[name], original))
 
             # now that we have moved the channels axis to the last position,
             # change the channel_axis argument to -1
@@ -425,6 +435,9 @@ class channel_as_last_axis:
 
             # Call the function with the fixed arguments
             out = func(*new_args, **kwargs)
+            for view, original in moved_kwargs:
+                if out is view:
+                    return original
             if self.multichannel_output:
                 out = np.moveaxis(out, -1, channel_axis[0])
             return out
@@ -1,3 +1,4 @@
+from functools import partial
 from itertools import product
 import numpy as np
 from .._shared import utils
@@ -33,7 +34,10 @@ def _generate_shifts(ndim, multichannel, max_shifts, shift_steps=1):
     elif multichannel and len(shift_steps) == ndim - 1:
         shift_steps = tuple(shift_steps) + (1, )
     elif len(shift_steps) != ndim:
-        raise ValueError("max_shifts should have length ndim")
+        raise ValueError("shift_steps should have length ndim")
+
+    if any(s < 0 for s in max_shifts):
+        raise ValueError("max_shifts must all be >= 0")
 
     if any(s < 1 for s in shift_steps):
         raise ValueError("shift_steps must all be >= 1")
@@ -47,10 +51,51 @@ def _generate_shifts(ndim, multichannel, max_shifts, shift_steps=1):
                      s, t in zip(max_shifts, shift_steps)])
 
 
+def _roll_into(a, shift, out):
+    """Circularly shift `a` by `shift` along its leading axes into `out`.
+
+    Equivalent to ``out[...] = np.roll(a, shift, axis=range(len(shift)))``,
+    but copies each of the (up to ``2**len(shift)``) wrapped blocks directly
+    instead of allocating a new array.
+
+    Examples
+    --------
+    >>> a = np.arange(6).reshape(2, 3)
+    >>> out = np.empty_like(a)
+    >>> _roll_into(a, (1, -1), out)
+    >>> out
+    array([[4, 5, 3],
+           [1, 2, 0]])
+    """
+    blocks = []
+    for n, s in zip(a.shape, shift):
+        s %= n or 1  # zero-length axes have nothing to roll
+        if s == 0:
+            blocks.append([(slice(None), slice(None))])
+        else:
+            # (source, destination) slices of the two wrapped pieces
+            blocks.append([(slice(0, n - s), slice(s, n)),
+                           (slice(n - s, n), slice(0, s))])
+    for block in product(*blocks):
+        src, dst = zip(*block)
+        out[dst] = a[src]
+
+
+def _run_one_shift(shift, x, func, func_kw):
+    """Apply `func` to `x` shifted by `shift` and shift the result back."""
+    xs = np.empty_like(x)
+    _roll_into(x, shift, xs)
+    tmp = func(xs, **func_kw)
+    out = np.empty_like(tmp)
+    _roll_into(tmp, tuple(-s for s in shift), out)
+    return out
+
+
 @utils.channel_as_last_axis()
 @utils.deprecate_multichannel_kwarg(multichannel_position=5)
 def cycle_spin(x, func, max_shifts, shift_steps=1, num_workers=None,
-               multichannel=False, func_kw={}, *, channel_axis=None):
+               multichannel=False, func_kw={}, *, channel_axis=None,
+               pool=None):
     """Cycle spinning (repeatedly apply func to shifted versions of x).
 
     Parameters
@@ -85,6 +130,17 @@ def cycle_spin(x, func, max_shifts, shift_steps=1, num_workers=None,
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    pool : concurrent.futures.Executor, optional
+        Executor used to apply ``func`` to the shifted versions of ``x``,
+        e.g. a ``concurrent.futures.ThreadPoolExecutor``. If given,
+        ``num_workers`` is ignored and dask is not needed. An existing pool
+        can be shared between several calls to avoid starting new workers
+        each time. With a ``concurrent.futures.ProcessPoolExecutor``,
+        ``func`` and ``func_kw`` must be picklable (e.g. ``func`` must be a
+        module-level function rather than a lambda).
+
+        .. versionadded:: 0.20
+           ``pool`` was added in 0.20.
 
     Returns
     -------
@@ -118,23 +174,33 @@ def cycle_spin(x, func, max_shifts, shift_steps=1, num_workers=None,
     >>> from skimage.restoration import denoise_wavelet, cycle_spin
     >>> img = img_as_float(skimage.data.camera())
     >>> sigma = 0.1
-    >>> img = img + sigma * np.random.standard_normal(img.shape)
+    >>> rng = np.random.default_rng()
+    >>> img = img + sigma * rng.standard_normal(img.shape)
     >>> denoised = cycle_spin(img, func=denoise_wavelet,
     ...                       max_shifts=3)
 
     """
-    x = np.asanyarray(x)
     multichannel = channel_axis is not None
-    all_shifts = _generate_shifts(x.ndim, multichannel, max_shifts,
+    # validate the shifts before doing any work on x
+    all_shifts = _generate_shifts(np.ndim(x), multichannel, max_shifts,
                                   shift_steps)
     all_shifts = list(all_shifts)
-    roll_axes = tuple(range(x.ndim))
-
-    def _run_one_shift(shift):
-        # shift, apply function, inverse shift
-        xs = np.roll(x, shift, axis=roll_axes)
-        tmp = func(xs, **func_kw)
-        return np.roll(tmp, tuple(-s for s in shift), axis=roll_axes)
+    x = np.asanyarray(x)
+    if len(all_shifts) == 1 and not any(all_shifts[0]):
+        # only the zero shift: nothing to average
+        return func(x, **func_kw)
+
+    # a module-level function, so that it can be pickled for process pools
+    run_one_shift = partial(_run_one_shift, x=x, func=func, func_kw=func_kw)
+
+    if pool is not None:
+        # the results arrive in order, so the sum is deterministic
+        results = pool.map(run_one_shift, all_shifts)
+        mean = next(results)
+        for result in results:
+            mean += result
+        mean /= len(all_shifts)
+        return mean
 
     if not dask_available and (num_workers is None or num_workers > 1):
         num_workers = 1
@@ -144,14 +210,25 @@ def cycle_spin(x, func, max_shifts, shift_steps=1, num_workers=None,
              'when calling the `cycle_spin` function')
     # compute a running average across the cycle shifts
     if num_workers == 1:
-        # serial processing
-        mean = _run_one_shift(all_shifts[0])
-        for shift in all_shifts[1:]:
-            mean += _run_one_shift(shift)
+        # serial processing, reusing the buffers for the shifted input and
+        # the shifted back output of func
+        xs = np.empty_like(x)
+        mean = buf = None
+        for shift in all_shifts:
+            _roll_into(x, shift, xs)
+            tmp = func(xs, **func_kw)
+            if mean is None:
+                mean = np.empty_like(tmp)
+                _roll_into(tmp, tuple(-s for s in shift), mean)
+                continue
+            if buf is None:
+                buf = np.empty_like(tmp)
+            _roll_into(tmp, tuple(-s for s in shift), buf)
+            mean += buf
         mean /= len(all_shifts)
     else:
         # multithreaded via dask
-        futures = [dask.delayed(_run_one_shift)(s) for s in all_shifts]
+        futures = [dask.delayed(run_one_shift)(s) for s in all_shifts]
         mean = sum(futures) / len(futures)
         mean = mean.compute(num_workers=num_workers)
     return mean
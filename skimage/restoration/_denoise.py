@@ -179,7 +179,36 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     >>> denoised = denoise_bilateral(noisy, sigma_color=0.05, sigma_spatial=15,
     ...                              channel_axis=-1)
     """
+    return _denoise_bilateral_batch(image, [(sigma_color, sigma_spatial)],
+                                    win_size, bins, mode, cval,
+                                    channel_axis=channel_axis)[0]
+
+
+def _denoise_bilateral_batch(image, params, win_size=None, bins=10000,
+                             mode='constant', cval=0, *, channel_axis=None):
+    """Denoise an image with the bilateral filter for several sigma pairs.
+
+    This is equivalent to calling `denoise_bilateral` once for each
+    ``(sigma_color, sigma_spatial)`` pair in `params`, but the input checks,
+    the conversion to float and the lookup tables are shared between calls.
+
+    Parameters
+    ----------
+    image : ndarray, shape (M, N[, 3])
+        Input image, 2D grayscale or RGB.
+    params : sequence of tuple of float
+        ``(sigma_color, sigma_spatial)`` pairs to filter the image with. See
+        `denoise_bilateral` for their meaning.
+    win_size, bins, mode, cval, channel_axis
+        See `denoise_bilateral`.
+
+    Returns
+    -------
+    denoised : list of ndarray
+        Denoised images, one for each pair in `params`.
+    """
     if channel_axis is not None:
+        image = np.moveaxis(image, channel_axis, -1)
         if image.ndim != 3:
             if image.ndim == 2:
                 raise ValueError("Use ``multichannel=False`` for 2D grayscale "
@@ -210,14 +239,12 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
                              f'but input image has {image.shape} shape. Use '
                              f'``channel_axis=-1`` for 2D RGB images.')
 
-    if win_size is None:
-        win_size = max(5, 2 * int(ceil(3 * sigma_spatial)) + 1)
-
     min_value = image.min()
     max_value = image.max()
 
     if min_value == max_value:
-        return image
+        return [np.moveaxis(image, -1, channel_axis)
+                if channel_axis is not None else image for _ in params]
 
     # if image.max() is 0, then dist_scale can have an unverified value
     # and color_lut[<int>(dist * dist_scale)] may cause a segmentation fault
@@ -227,16 +254,6 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     image = np.atleast_3d(img_as_float(image))
     image = np.ascontiguousarray(image)
 
-    sigma_color = sigma_color or image.std()
-
-    color_lut = _compute_color_lut(bins, sigma_color, max_value,
-                                   dtype=image.dtype)
-
-    range_lut = _compute_spatial_lut(win_size, sigma_spatial,
-                                     dtype=image.dtype)
-
-    out = np.empty(image.shape, dtype=image.dtype)
-
     dims = image.shape[2]
 
     # There are a number of arrays needed in the Cython function.
@@ -245,16 +262,47 @@ def denoise_bilateral(image, win_size=None, sigma_color=None, sigma_spatial=1,
     # where needed within Cython.
     empty_dims = np.empty(dims, dtype=image.dtype)
 
+    if any(not sigma_color for sigma_color, _ in params):
+        image_std = image.std()
+
+    # the lookup tables only depend on the sigmas, so they are computed once
+    # for each distinct value
+    color_luts = {}
+    range_luts = {}
+    lut_max_value = max_value
     if min_value < 0:
         image = image - min_value
         max_value -= min_value
-    _denoise_bilateral(image, max_value, win_size, sigma_color, sigma_spatial,
-                       bins, mode, cval, color_lut, range_lut, empty_dims, out)
-    # need to drop the added channels axis for grayscale images
-    out = np.squeeze(out)
-    if min_value < 0:
-        out += min_value
-    return out
+
+    outs = []
+    for sigma_color, sigma_spatial in params:
+        sigma_color = sigma_color or image_std
+        if sigma_color not in color_luts:
+            color_luts[sigma_color] = _compute_color_lut(
+                bins, sigma_color, lut_max_value, dtype=image.dtype)
+        color_lut = color_luts[sigma_color]
+
+        if win_size is None:
+            size = max(5, 2 * int(ceil(3 * sigma_spatial)) + 1)
+        else:
+            size = win_size
+        if (size, sigma_spatial) not in range_luts:
+            range_luts[size, sigma_spatial] = _compute_spatial_lut(
+                size, sigma_spatial, dtype=image.dtype)
+        range_lut = range_luts[size, sigma_spatial]
+
+        out = np.empty(image.shape, dtype=image.dtype)
+        _denoise_bilateral(image, max_value, size, sigma_color, sigma_spatial,
+                           bins, mode, cval, color_lut, range_lut, empty_dims,
+                           out)
+        # need to drop the added channels axis for grayscale images
+        out = np.squeeze(out)
+        if min_value < 0:
+            out += min_value
+        if channel_axis is not None:
+            out = np.moveaxis(out, -1, channel_axis)
+        outs.append(out)
+    return outs
 
 
 @utils.channel_as_last_axis()
@@ -384,11 +432,17 @@ def _denoise_tv_chambolle_nd(image, weight=0.1, eps=2.e-4, max_num_iter=200):
     p = np.zeros((image.ndim, ) + image.shape, dtype=image.dtype)
     g = np.zeros_like(p)
     d = np.zeros_like(image)
+    # work buffers reused across iterations to avoid per-iteration temporaries
+    # (out starts as the input, which is also the result without iterations)
+    out = image.copy()
+    norm = np.empty_like(image)
+    tau = 1. / (2.*ndim)
     i = 0
     while i < max_num_iter:
         if i > 0:
             # d will be the (negative) divergence of p
-            d = -p.sum(0)
+            np.sum(p, axis=0, out=d)
+            np.negative(d, out=d)
             slices_d = [slice(None), ] * ndim
             slices_p = [slice(None), ] * (ndim + 1)
             for ax in range(ndim):
@@ -398,10 +452,11 @@ def _denoise_tv_chambolle_nd(image, weight=0.1, eps=2.e-4, max_num_iter=200):
                 d[tuple(slices_d)] += p[tuple(slices_p)]
                 slices_d[ax] = slice(None)
                 slices_p[ax+1] = slice(None)
-            out = image + d
+            np.add(image, d, out=out)
+            np.square(d, out=norm)
+            E = norm.sum()
         else:
-            out = image
-        E = (d ** 2).sum()
+            E = 0.
 
         # g stores the gradients of out along each axis
         # e.g. g[0] is the first order finite difference along axis 0
@@ -409,15 +464,20 @@ def _denoise_tv_chambolle_nd(image, weight=0.1, eps=2.e-4, max_num_iter=200):
         for ax in range(ndim):
             slices_g[ax+1] = slice(0, -1)
             slices_g[0] = ax
-            g[tuple(slices_g)] = np.diff(out, axis=ax)
+            np.subtract(out[utils.slice_at_axis(slice(1, None), ax)],
+                        out[utils.slice_at_axis(slice(None, -1), ax)],
+                        out=g[tuple(slices_g)])
             slices_g[ax+1] = slice(None)
 
-        norm = np.sqrt((g ** 2).sum(axis=0))[np.newaxis, ...]
+        np.square(g[0], out=norm)
+        for ax in range(1, ndim):
+            norm += g[ax] ** 2
+        np.sqrt(norm, out=norm)
         E += weight * norm.sum()
-        tau = 1. / (2.*ndim)
         norm *= tau / weight
         norm += 1.
-        p -= tau * g
+        g *= tau
+        p -= g
         p /= norm
         E /= float(image.size)
         if i == 0:
@@ -546,9 +606,9 @@ def _bayes_thresh(details, var):
     return thresh
 
 
-def _universal_thresh(img, sigma):
+def _universal_thresh(size, sigma):
     """ Universal threshold used by the VisuShrink method """
-    return sigma*np.sqrt(2*np.log(img.size))
+    return sigma*np.sqrt(2*np.log(size))
 
 
 def _sigma_est_dwt(detail_coeffs, distribution='Gaussian'):
@@ -586,6 +646,18 @@ def _sigma_est_dwt(detail_coeffs, distribution='Gaussian'):
     return sigma
 
 
+def _default_wavelet_levels(image_shape, wavelet):
+    """Number of wavelet decomposition levels used when none are given.
+
+    This is three less than the maximum number of possible decomposition
+    levels for `image_shape`, but at least one, skipping the coarsest wavelet
+    scales (see Notes in `denoise_wavelet`).
+    """
+    # Determine the maximum number of possible levels for image
+    max_levels = pywt.dwtn_max_level(image_shape, wavelet)
+    return max(max_levels - 3, 1)
+
+
 def _wavelet_threshold(image, wavelet, method=None, threshold=None,
                        sigma=None, mode='soft', wavelet_levels=None):
     """Perform wavelet thresholding.
@@ -642,25 +714,59 @@ def _wavelet_threshold(image, wavelet, method=None, threshold=None,
              f'wavelets such as {wavelet.name},results are '
              f'likely to be suboptimal.')
 
-    # original_extent is used to workaround PyWavelets issue #80
-    # odd-sized input results in an image with 1 extra sample after waverecn
-    original_extent = tuple(slice(s) for s in image.shape)
-
     # Determine the number of wavelet decomposition levels
     if wavelet_levels is None:
-        # Determine the maximum number of possible levels for image
-        wavelet_levels = pywt.dwtn_max_level(image.shape, wavelet)
-
-        # Skip coarsest wavelet scales (see Notes in docstring).
-        wavelet_levels = max(wavelet_levels - 3, 1)
+        wavelet_levels = _default_wavelet_levels(image.shape, wavelet)
 
     coeffs = pywt.wavedecn(image, wavelet=wavelet, level=wavelet_levels)
+    return _wavelet_threshold_coeffs(coeffs, image.shape, wavelet,
+                                     method=method, threshold=threshold,
+                                     sigma=sigma, mode=mode)
+
+
+def _wavelet_threshold_coeffs(coeffs, image_shape, wavelet, method=None,
+                              threshold=None, sigma=None, mode='soft'):
+    """Threshold a wavelet decomposition and reconstruct the image from it.
+
+    This performs the thresholding and inverse transform steps of
+    `_wavelet_threshold`, so that several thresholds can be applied to a single
+    forward decomposition.
+
+    Parameters
+    ----------
+    coeffs : list
+        Multilevel wavelet decomposition as returned by ``pywt.wavedecn``. It
+        is not modified.
+    image_shape : tuple of int
+        Shape of the decomposed image.
+    wavelet : string or pywt.Wavelet
+        The wavelet used for the decomposition.
+    method : {'BayesShrink', 'VisuShrink'}, optional
+        Thresholding method to be used. See `_wavelet_threshold`.
+    threshold : float, optional
+        The thresholding value to apply during wavelet coefficient
+        thresholding. See `_wavelet_threshold`.
+    sigma : float, optional
+        The standard deviation of the noise. The noise is estimated from the
+        finest detail coefficients when sigma is None (the default).
+    mode : {'soft', 'hard'}, optional
+        The type of thresholding performed.
+
+    Returns
+    -------
+    out : ndarray
+        Denoised image of shape ``image_shape``.
+    """
+    # original_extent is used to workaround PyWavelets issue #80
+    # odd-sized input results in an image with 1 extra sample after waverecn
+    original_extent = tuple(slice(s) for s in image_shape)
+
     # Detail coefficients at each decomposition level
     dcoeffs = coeffs[1:]
 
     if sigma is None:
-        # Estimate the noise via the method in [2]_
-        detail_coeffs = dcoeffs[-1]['d' * image.ndim]
+        # Estimate the noise via the method in [2]_ of `_wavelet_threshold`
+        detail_coeffs = dcoeffs[-1]['d' * len(image_shape)]
         sigma = _sigma_est_dwt(detail_coeffs, distribution='Gaussian')
 
     if method is not None and threshold is not None:
@@ -678,7 +784,7 @@ def _wavelet_threshold(image, wavelet, method=None, threshold=None,
                          for level in dcoeffs]
         elif method == "VisuShrink":
             # The VisuShrink thresholds from [2]_ in docstring
-            threshold = _universal_thresh(image, sigma)
+            threshold = _universal_thresh(np.prod(image_shape), sigma)
         else:
             raise ValueError(f'Unrecognized method: {method}')
 
@@ -752,12 +858,12 @@ def _rescale_sigma_rgb2ycbcr(sigmas):
     return sigmas
 
 
-@utils.channel_as_last_axis()
+@utils.channel_as_last_axis(channel_kwarg_names=('out',))
 @utils.deprecate_multichannel_kwarg(multichannel_position=5)
 def denoise_wavelet(image, sigma=None, wavelet='db1', mode='soft',
                     wavelet_levels=None, multichannel=False,
                     convert2ycbcr=False, method='BayesShrink',
-                    rescale_sigma=True, *, channel_axis=None):
+                    rescale_sigma=True, *, channel_axis=None, out=None):
     """Perform wavelet denoising on an image.
 
     Parameters
@@ -806,11 +912,20 @@ def denoise_wavelet(image, sigma=None, wavelet='db1', mode='soft',
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    out : ndarray, optional
+        Array of the same shape as `image` to store the result in. Its dtype
+        must be the floating point dtype of the result, i.e. ``float32`` for
+        ``float16`` and ``float32`` images and ``float64`` otherwise. If None
+        (default), a new array is allocated. This allows repeated calls on
+        images of the same shape to reuse one output array.
+
+        .. versionadded:: 0.20
+           ``out`` was added in 0.20.
 
     Returns
     -------
     out : ndarray
-        Denoised image.
+        Denoised image. If `out` was given, this is that same array.
 
     Notes
     -----
@@ -874,6 +989,15 @@ def denoise_wavelet(image, sigma=None, wavelet='db1', mode='soft',
 
     """
     multichannel = channel_axis is not None
+    if out is not None:
+        if out.shape != image.shape:
+            raise ValueError(f'out must have the same shape as image '
+                             f'({image.shape}), but has shape {out.shape}.')
+        float_dtype = _supported_float_type(image.dtype)
+        if out.dtype != float_dtype:
+            raise ValueError(f'out must have dtype {float_dtype} for an image '
+                             f'of dtype {image.dtype}, but has dtype '
+                             f'{out.dtype}.')
     if method not in ["BayesShrink", "VisuShrink"]:
         raise ValueError(f'Invalid method: {method}. The currently supported '
                          f'methods are "BayesShrink" and "VisuShrink".')
@@ -888,51 +1012,53 @@ def denoise_wavelet(image, sigma=None, wavelet='db1', mode='soft',
                                                        sigma,
                                                        multichannel,
                                                        rescale_sigma)
+    if clip_output:
+        # computed before anything is written to `out`, which may be `image`
+        clip_range = (-1, 1) if image.min() < 0 else (0, 1)
     if multichannel:
         if convert2ycbcr:
-            out = color.rgb2ycbcr(image)
+            denoised = color.rgb2ycbcr(image)
             # convert user-supplied sigmas to the new colorspace as well
             if rescale_sigma:
                 sigma = _rescale_sigma_rgb2ycbcr(sigma)
             for i in range(3):
                 # renormalizing this color channel to live in [0, 1]
-                _min, _max = out[..., i].min(), out[..., i].max()
+                _min, _max = denoised[..., i].min(), denoised[..., i].max()
                 scale_factor = _max - _min
                 if scale_factor == 0:
                     # skip any channel containing only zeros!
                     continue
-                channel = out[..., i] - _min
+                channel = denoised[..., i] - _min
                 channel /= scale_factor
                 sigma_channel = sigma[i]
                 if sigma_channel is not None:
                     sigma_channel /= scale_factor
-                out[..., i] = denoise_wavelet(channel,
-                                              wavelet=wavelet,
-                                              method=method,
-                                              sigma=sigma_channel,
-                                              mode=mode,
-                                              wavelet_levels=wavelet_levels,
-                                              rescale_sigma=rescale_sigma)
-                out[..., i] = out[..., i] * scale_factor
-                out[..., i] += _min
-            out = color.ycbcr2rgb(out)
+                denoised[..., i] = denoise_wavelet(
+                    channel, wavelet=wavelet, method=method,
+                    sigma=sigma_channel, mode=mode,
+                    wavelet_levels=wavelet_levels,
+                    rescale_sigma=rescale_sigma)
+                denoised[..., i] = denoised[..., i] * scale_factor
+                denoised[..., i] += _min
+            denoised = color.ycbcr2rgb(denoised)
         else:
-            out = np.empty_like(image)
+            # each channel is written straight into the output array
+            denoised = np.empty_like(image) if out is None else out
             for c in range(image.shape[-1]):
-                out[..., c] = _wavelet_threshold(image[..., c],
-                                                 wavelet=wavelet,
-                                                 method=method,
-                                                 sigma=sigma[c], mode=mode,
-                                                 wavelet_levels=wavelet_levels)
+                denoised[..., c] = _wavelet_threshold(
+                    image[..., c], wavelet=wavelet, method=method,
+                    sigma=sigma[c], mode=mode, wavelet_levels=wavelet_levels)
     else:
-        out = _wavelet_threshold(image, wavelet=wavelet, method=method,
-                                 sigma=sigma, mode=mode,
-                                 wavelet_levels=wavelet_levels)
+        denoised = _wavelet_threshold(image, wavelet=wavelet, method=method,
+                                      sigma=sigma, mode=mode,
+                                      wavelet_levels=wavelet_levels)
 
+    if out is not None and denoised is not out:
+        out[...] = denoised
+        denoised = out
     if clip_output:
-        clip_range = (-1, 1) if image.min() < 0 else (0, 1)
-        out = np.clip(out, *clip_range, out=out)
-    return out
+        denoised = np.clip(denoised, *clip_range, out=denoised)
+    return denoised
 
 
 @utils.deprecate_multichannel_kwarg(multichannel_position=2)
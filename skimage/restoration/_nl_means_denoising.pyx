@@ -5,6 +5,7 @@
 
 import numpy as np
 cimport numpy as cnp
+from cython.parallel cimport prange
 
 from .._shared.fast_exp cimport _fast_exp
 from .._shared.fused_numerics cimport np_floats
@@ -110,6 +111,120 @@ cdef inline np_floats patch_distance_3d(np_floats [:, :, :] p1,
     return _fast_exp(-max(0.0, distance))
 
 
+cdef inline void _nl_means_denoising_2d_row(np_floats [:, :, ::1] padded,
+                                            np_floats [:, :, ::1] result,
+                                            np_floats [:, ::1] new_values,
+                                            np_floats [:, ::1] w,
+                                            Py_ssize_t row, Py_ssize_t s,
+                                            Py_ssize_t d,
+                                            np_floats var) nogil:
+    """
+    Denoise a single row of a 2-D image, see `_nl_means_denoising_2d`.
+
+    ``padded`` is the reflect-padded input image, the result is written to
+    ``result[row]`` and ``new_values[row]`` is used as per-channel scratch
+    space so that different rows can be processed concurrently.
+    """
+    cdef Py_ssize_t n_row = result.shape[0]
+    cdef Py_ssize_t n_col = result.shape[1]
+    cdef Py_ssize_t n_channels = result.shape[2]
+    cdef Py_ssize_t offset = s / 2
+    cdef Py_ssize_t col, i, j, channel, i_start, i_end, j_start, j_end
+    cdef np_floats weight_sum, weight
+    cdef np_floats [:, :, :] central_patch
+
+    # Search window along rows, taking padding into account
+    i_start = row - min(d, row)
+    i_end = row + min(d + 1, n_row - row)
+
+    # Iterate over columns, taking padding into account
+    for col in range(n_col):
+        # Initialize per-channel bins
+        new_values[row, :] = 0
+        # Reset weights for each local region
+        weight_sum = 0
+
+        central_patch = padded[row:row+s, col:col+s, :]
+        j_start = col - min(d, col)
+        j_end = col + min(d + 1, n_col - col)
+
+        # Iterate over local 2d patch for each pixel
+        for i in range(i_start, i_end):
+            for j in range(j_start, j_end):
+                weight = patch_distance_2d[np_floats](
+                    central_patch,
+                    padded[i:i+s, j:j+s, :],
+                    w, s, var, n_channels)
+
+                # Collect results in weight sum
+                weight_sum += weight
+                # Apply to each channel multiplicatively
+                for channel in range(n_channels):
+                    new_values[row, channel] += weight * padded[i+offset,
+                                                                j+offset,
+                                                                channel]
+
+        # Normalize the result
+        for channel in range(n_channels):
+            result[row, col, channel] = new_values[row, channel] / weight_sum
+
+
+cdef inline void _nl_means_denoising_3d_plane(np_floats [:, :, ::1] padded,
+                                              np_floats [:, :, ::1] result,
+                                              np_floats [:, :, ::1] w,
+                                              Py_ssize_t pln, Py_ssize_t s,
+                                              Py_ssize_t d,
+                                              np_floats var) nogil:
+    """
+    Denoise a single plane of a 3-D image, see `_nl_means_denoising_3d`.
+
+    ``padded`` is the reflect-padded input image and the result is written to
+    ``result[pln]``.
+    """
+    cdef Py_ssize_t n_pln = result.shape[0]
+    cdef Py_ssize_t n_row = result.shape[1]
+    cdef Py_ssize_t n_col = result.shape[2]
+    cdef Py_ssize_t offset = s / 2
+    cdef Py_ssize_t i_start, i_end, j_start, j_end, k_start, k_end
+    cdef Py_ssize_t row, col, i, j, k
+    cdef np_floats new_value
+    cdef np_floats weight_sum, weight
+    cdef np_floats [:, :, :] central_patch
+
+    i_start = pln - min(d, pln)
+    i_end = pln + min(d + 1, n_pln - pln)
+    # Iterate over rows, taking padding into account
+    for row in range(n_row):
+        j_start = row - min(d, row)
+        j_end = row + min(d + 1, n_row - row)
+        # Iterate over columns, taking padding into account
+        for col in range(n_col):
+            k_start = col - min(d, col)
+            k_end = col + min(d + 1, n_col - col)
+
+            central_patch = padded[pln:pln+s, row:row+s, col:col+s]
+
+            new_value = 0
+            weight_sum = 0
+
+            # Iterate over local 3d patch for each pixel
+            for i in range(i_start, i_end):
+                for j in range(j_start, j_end):
+                    for k in range(k_start, k_end):
+                        weight = patch_distance_3d[np_floats](
+                            central_patch,
+                            padded[i:i+s, j:j+s, k:k+s],
+                            w, s, var)
+                        # Collect results in weight sum
+                        weight_sum += weight
+                        new_value += weight * padded[i+offset,
+                                                     j+offset,
+                                                     k+offset]
+
+            # Normalize the result
+            result[pln, row, col] = new_value / weight_sum
+
+
 def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
                            Py_ssize_t d, cnp.float64_t h, cnp.float64_t var):
     """
@@ -153,14 +268,13 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
     cdef Py_ssize_t n_row, n_col, n_channels
     n_row, n_col, n_channels = image.shape[0], image.shape[1], image.shape[2]
     cdef Py_ssize_t offset = s / 2
-    cdef Py_ssize_t row, col, i, j, channel, i_start, i_end, j_start, j_end
-    cdef np_floats[::1] new_values = np.zeros(n_channels, dtype=dtype)
+    cdef Py_ssize_t row
+    cdef np_floats[:, ::1] new_values = np.zeros((n_row, n_channels),
+                                                 dtype=dtype)
     cdef np_floats[:, :, ::1] padded = np.ascontiguousarray(
         np.pad(image, ((offset, offset), (offset, offset), (0, 0)),
                mode='reflect'))
     cdef np_floats [:, :, ::1] result = np.empty_like(image)
-    cdef np_floats new_value
-    cdef np_floats weight_sum, weight
 
     cdef np_floats A = ((s - 1.) / 4.)
     cdef np_floats [::1] range_vals = np.arange(-offset, offset + 1,
@@ -170,45 +284,13 @@ def _nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image, Py_ssize_t s,
         np.exp(-(xg_row * xg_row + xg_col * xg_col) / (2 * A * A)))
     w *= 1. / (n_channels * np.sum(w) * h * h)
 
-    cdef np_floats [:, :, :] central_patch
     var *= 2
 
-    # Iterate over rows, taking padding into account
-    with nogil:
-        for row in range(n_row):
-            # Iterate over columns, taking padding into account
-            i_start = row - min(d, row)
-            i_end = row + min(d + 1, n_row - row)
-
-            for col in range(n_col):
-                # Initialize per-channel bins
-                new_values[:] = 0
-                # Reset weights for each local region
-                weight_sum = 0
-
-                central_patch = padded[row:row+s, col:col+s, :]
-                j_start = col - min(d, col)
-                j_end = col + min(d + 1, n_col - col)
-
-                # Iterate over local 2d patch for each pixel
-                for i in range(i_start, i_end):
-                    for j in range(j_start, j_end):
-                        weight = patch_distance_2d[np_floats](
-                            central_patch,
-                            padded[i:i+s, j:j+s, :],
-                            w, s, var, n_channels)
-
-                        # Collect results in weight sum
-                        weight_sum += weight
-                        # Apply to each channel multiplicatively
-                        for channel in range(n_channels):
-                            new_values[channel] += weight * padded[i+offset,
-                                                                   j+offset,
-                                                                   channel]
-
-                # Normalize the result
-                for channel in range(n_channels):
-                    result[row, col, channel] = new_values[channel] / weight_sum
+    # Rows are independent, so they are distributed over threads. Each row
+    # accumulates into its own slice of new_values.
+    for row in prange(n_row, nogil=True, schedule='static'):
+        _nl_means_denoising_2d_row[np_floats](padded, result, new_values, w,
+                                              row, s, d, var)
 
     return np.squeeze(np.asarray(result))
 
@@ -249,15 +331,12 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
 
     cdef Py_ssize_t n_pln, n_row, n_col
     n_pln, n_row, n_col = image.shape[0], image.shape[1], image.shape[2]
-    cdef Py_ssize_t i_start, i_end, j_start, j_end, k_start, k_end
-    cdef Py_ssize_t pln, row, col, i, j, k
+    cdef Py_ssize_t pln
     cdef Py_ssize_t offset = s / 2
     # pad the image so that boundaries are denoised as well
     cdef np_floats [:, :, ::1] padded = np.ascontiguousarray(
         np.pad(image, offset, mode='reflect'))
     cdef np_floats [:, :, ::1] result = np.empty_like(image)
-    cdef np_floats new_value
-    cdef np_floats weight_sum, weight
 
     cdef np_floats A = ((s - 1.) / 4.)
     cdef np_floats [::] range_vals = np.arange(-offset, offset + 1,
@@ -269,44 +348,12 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
                (2 * A * A)))
     w *= 1. / (np.sum(w) * h * h)
 
-    cdef np_floats [:, :, :] central_patch
     var *= 2
 
-    # Iterate over planes, taking padding into account
-    with nogil:
-        for pln in range(n_pln):
-            i_start = pln - min(d, pln)
-            i_end = pln + min(d + 1, n_pln - pln)
-            # Iterate over rows, taking padding into account
-            for row in range(n_row):
-                j_start = row - min(d, row)
-                j_end = row + min(d + 1, n_row - row)
-                # Iterate over columns, taking padding into account
-                for col in range(n_col):
-                    k_start = col - min(d, col)
-                    k_end = col + min(d + 1, n_col - col)
-
-                    central_patch = padded[pln:pln+s, row:row+s, col:col+s]
-
-                    new_value = 0
-                    weight_sum = 0
-
-                    # Iterate over local 3d patch for each pixel
-                    for i in range(i_start, i_end):
-                        for j in range(j_start, j_end):
-                            for k in range(k_start, k_end):
-                                weight = patch_distance_3d[np_floats](
-                                    central_patch,
-                                    padded[i:i+s, j:j+s, k:k+s],
-                                    w, s, var)
-                                # Collect results in weight sum
-                                weight_sum += weight
-                                new_value += weight * padded[i+offset,
-                                                             j+offset,
-                                                             k+offset]
-
-                    # Normalize the result
-                    result[pln, row, col] = new_value / weight_sum
+    # Planes are independent, so they are distributed over threads
+    for pln in prange(n_pln, nogil=True, schedule='static'):
+        _nl_means_denoising_3d_plane[np_floats](padded, result, w, pln, s, d,
+                                                var)
 
     return np.asarray(result)
 
@@ -1,17 +1,22 @@
 import functools
 import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 import pytest
 import pywt
-from numpy.testing import (assert_array_almost_equal, assert_array_equal,
-                           assert_warns)
+from numpy.testing import (assert_allclose, assert_array_almost_equal,
+                           assert_array_equal, assert_warns)
 
 from skimage import color, data, img_as_float, restoration
 from skimage._shared._warnings import expected_warnings
 from skimage._shared.utils import _supported_float_type, slice_at_axis
 from skimage.metrics import peak_signal_noise_ratio, structural_similarity
-from skimage.restoration._denoise import _wavelet_threshold
+from skimage.restoration._cycle_spin import _roll_into
+from skimage.restoration._denoise import (_default_wavelet_levels,
+                                          _denoise_bilateral_batch,
+                                          _wavelet_threshold,
+                                          _wavelet_threshold_coeffs)
 
 try:
     import dask  # noqa
@@ -23,18 +28,107 @@ else:
     DASK_NOT_INSTALLED_WARNING = None
 
 
-np.random.seed(1234)
+# Pools of standard normal and uniform noise shared by the tests below. Views
+# of these are much cheaper than drawing new random numbers in every test.
+_POOL_SIZE = 2**17
+_pool_rng = np.random.default_rng(1234)
+_NOISE_POOL = _pool_rng.standard_normal(_POOL_SIZE)
+_UNIFORM_POOL = _pool_rng.random(_POOL_SIZE)
+_NOISE_POOL.setflags(write=False)
+_UNIFORM_POOL.setflags(write=False)
+
+
+@pytest.fixture(scope='module')
+def _rstate_and_seed_state():
+    rstate = np.random.default_rng(1234)
+    return rstate, rstate.bit_generator.state
+
+
+@pytest.fixture
+def rstate(_rstate_and_seed_state):
+    """Random generator shared by the tests, reset to its seed for each one."""
+    rstate, state = _rstate_and_seed_state
+    rstate.bit_generator.state = state
+    return rstate
+
+
+def _noise(shape):
+    """Read-only array of standard normal noise with the given shape."""
+    return _NOISE_POOL[:np.prod(shape)].reshape(shape)
+
+
+def _uniform_noise(shape):
+    """Read-only array of noise uniform over [0, 1) with the given shape."""
+    return _UNIFORM_POOL[:np.prod(shape)].reshape(shape)
 
 
 astro = img_as_float(data.astronaut()[:128, :128])
 astro_gray = color.rgb2gray(astro)
 checkerboard_gray = img_as_float(data.checkerboard())
 checkerboard = color.gray2rgb(checkerboard_gray)
+# shared by all tests, so make sure none of them modifies these in place
+for _img in (astro, astro_gray, checkerboard_gray, checkerboard):
+    _img.setflags(write=False)
 # versions with one odd-sized dimension
 astro_gray_odd = astro_gray[:, :-1]
 astro_odd = astro[:, :-1]
 
 
+# images that `_noisy` can add noise to
+_IMAGES = {
+    'astro_gray': astro_gray,
+    'checkerboard': checkerboard,
+    'checkerboard_gray': checkerboard_gray,
+    'checkerboard_crop': checkerboard[:50, :50],
+    'checkerboard_gray_crop': checkerboard_gray[:50, :50],
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _noisy(key, sigma_frac, seed=1234):
+    """Image ``_IMAGES[key]`` with uniform noise, clipped to [0, 1].
+
+    The noise amplitude is ``sigma_frac`` times the standard deviation of the
+    image. Results are cached, so the returned array is read-only.
+    """
+    img = _IMAGES[key]
+    rstate = np.random.default_rng(seed)
+    noisy = img + sigma_frac * img.std() * rstate.random(img.shape)
+    noisy = np.clip(noisy, 0, 1)
+    noisy.setflags(write=False)
+    return noisy
+
+
+def _add_noise(img, sigma, rstate):
+    """``img`` plus Gaussian noise with standard deviation ``sigma``.
+
+    The noise is scaled and offset in place, which avoids the temporaries of
+    ``img + sigma * rstate.standard_normal(img.shape)`` (same result).
+    """
+    noisy = rstate.standard_normal(img.shape)
+    noisy *= sigma
+    noisy += img
+    return noisy
+
+
+def _mse(a, b):
+    """Mean squared error, for comparisons where PSNR is monotonic in it."""
+    diff = np.subtract(a, b, dtype=np.float32)
+    return np.mean(np.square(diff, out=diff), dtype=np.float64)
+
+
+def _run_concurrently(func, image, kwargs_list):
+    """Call ``func(image, **kwargs)`` for each ``kwargs`` in its own thread.
+
+    The compiled denoising kernels release the GIL, so independent calls on
+    the same input run in parallel.
+    """
+    with ThreadPoolExecutor(max_workers=len(kwargs_list)) as executor:
+        futures = [executor.submit(func, image, **kwargs)
+                   for kwargs in kwargs_list]
+        return [future.result() for future in futures]
+
+
 float_dtypes = [np.float16, np.float32, np.float64]
 try:
     float_dtypes += [np.float128]
@@ -44,12 +138,8 @@ except AttributeError:
 
 @pytest.mark.parametrize('dtype', float_dtypes)
 def test_denoise_tv_chambolle_2d(dtype):
-    # astronaut image
-    img = astro_gray.astype(dtype, copy=True)
-    # add noise to astronaut
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    # clip noise so that it does not exceed allowed range for float images.
-    img = np.clip(img, 0, 1)
+    # astronaut image with noise, clipped to the allowed float range
+    img = _noisy('astro_gray', 0.5).astype(dtype)
     # denoise
     denoised_astro = restoration.denoise_tv_chambolle(img, weight=0.1)
     assert denoised_astro.dtype == _supported_float_type(img)
@@ -130,48 +220,49 @@ def test_denoise_tv_chambolle_float_result_range():
     assert np.min(denoised_int_astro) >= 0.0
 
 
-def test_denoise_tv_chambolle_3d():
-    """Apply the TV denoising algorithm on a 3D image representing a sphere."""
-    x, y, z = np.ogrid[0:40, 0:40, 0:40]
-    mask = (x - 22)**2 + (y - 20)**2 + (z - 17)**2 < 8**2
-    mask = 100 * mask.astype(float)
-    mask += 60
-    mask += 20 * np.random.rand(*mask.shape)
-    mask[mask < 0] = 0
-    mask[mask > 255] = 255
-    res = restoration.denoise_tv_chambolle(mask.astype(np.uint8), weight=0.1)
-    assert res.dtype == float
-    assert res.std() * 255 < mask.std()
-
-
-def test_denoise_tv_chambolle_1d():
-    """Apply the TV denoising algorithm on a 1D sinusoid."""
-    x = 125 + 100*np.sin(np.linspace(0, 8*np.pi, 1000))
-    x += 20 * np.random.rand(x.size)
-    x = np.clip(x, 0, 255)
-    res = restoration.denoise_tv_chambolle(x.astype(np.uint8), weight=0.1)
+@pytest.mark.parametrize(
+    'shape', [(1000,), (64, 64), (24, 24, 24), (8, 8, 8, 8)]
+)
+def test_denoise_tv_chambolle_nd(shape):
+    """Apply the TV denoising algorithm on 1D to 4D images."""
+    if len(shape) == 1:
+        # 1D sinusoid
+        im = 125 + 100*np.sin(np.linspace(0, 8*np.pi, shape[0]))
+        noise_amplitude = 20
+    elif len(shape) == 3:
+        # 3D image representing a sphere
+        x, y, z = np.ogrid[:shape[0], :shape[1], :shape[2]]
+        mask = (x - 13)**2 + (y - 12)**2 + (z - 10)**2 < 5**2
+        im = 100 * mask.astype(float) + 60
+        noise_amplitude = 20
+    else:
+        # pure noise
+        im = np.zeros(shape)
+        noise_amplitude = 255
+    im += noise_amplitude * _uniform_noise(shape)
+    # denoise in the [0, 1] range that an 8-bit input would be rescaled to
+    im = np.clip(im, 0, 255) / 255
+    res = restoration.denoise_tv_chambolle(im, weight=0.1)
     assert res.dtype == float
-    assert res.std() * 255 < x.std()
+    assert res.std() < im.std()
 
 
-def test_denoise_tv_chambolle_4d():
-    """ TV denoising for a 4D input."""
-    im = 255 * np.random.rand(8, 8, 8, 8)
-    res = restoration.denoise_tv_chambolle(im.astype(np.uint8), weight=0.1)
-    assert res.dtype == float
-    assert res.std() * 255 < im.std()
+@pytest.mark.parametrize('shape', [(16,), (8, 8), (4, 4, 4)])
+def test_denoise_tv_chambolle_no_iterations(shape):
+    # without any iteration the (float) input is returned unchanged
+    img = _uniform_noise(shape)
+    res = restoration.denoise_tv_chambolle(img, max_num_iter=0)
+    assert_array_equal(res, img)
 
 
-def test_denoise_tv_chambolle_weighting():
+def test_denoise_tv_chambolle_weighting(rstate):
     # make sure a specified weight gives consistent results regardless of
     # the number of input image dimensions
-    rstate = np.random.default_rng(1234)
-    img2d = astro_gray.copy()
-    img2d += 0.15 * rstate.standard_normal(img2d.shape)
+    img2d = _add_noise(astro_gray, 0.15, rstate)
     img2d = np.clip(img2d, 0, 1)
 
-    # generate 4D image by tiling
-    img4d = np.tile(img2d[..., None, None], (1, 1, 2, 2))
+    # generate 4D image by broadcasting (a read-only view, no copy)
+    img4d = np.broadcast_to(img2d[..., None, None], img2d.shape + (2, 2))
 
     w = 0.2
     denoised_2d = restoration.denoise_tv_chambolle(img2d, weight=w)
@@ -181,13 +272,10 @@ def test_denoise_tv_chambolle_weighting():
 
 
 def test_denoise_tv_bregman_2d():
-    img = checkerboard_gray.copy()
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard_gray', 0.5).copy()
 
-    out1 = restoration.denoise_tv_bregman(img, weight=10)
-    out2 = restoration.denoise_tv_bregman(img, weight=5)
+    out1, out2 = _run_concurrently(restoration.denoise_tv_bregman, img,
+                                   [dict(weight=10), dict(weight=5)])
 
     # make sure noise is reduced in the checkerboard cells
     assert img[30:45, 5:15].std() > out1[30:45, 5:15].std()
@@ -196,8 +284,7 @@ def test_denoise_tv_bregman_2d():
 
 def test_denoise_tv_bregman_float_result_range():
     # astronaut image
-    img = astro_gray.copy()
-    int_astro = np.multiply(img, 255).astype(np.uint8)
+    int_astro = np.multiply(astro_gray, 255).astype(np.uint8)
     assert np.max(int_astro) > 1
     denoised_int_astro = restoration.denoise_tv_bregman(int_astro, weight=60.0)
     # test if the value range of output float data is within [0.0:1.0]
@@ -207,13 +294,10 @@ def test_denoise_tv_bregman_float_result_range():
 
 
 def test_denoise_tv_bregman_3d():
-    img = checkerboard.copy()
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard', 0.5).copy()
 
-    out1 = restoration.denoise_tv_bregman(img, weight=10)
-    out2 = restoration.denoise_tv_bregman(img, weight=5)
+    out1, out2 = _run_concurrently(restoration.denoise_tv_bregman, img,
+                                   [dict(weight=10), dict(weight=5)])
 
     # make sure noise is reduced in the checkerboard cells
     assert img[30:45, 5:15].std() > out1[30:45, 5:15].std()
@@ -244,14 +328,13 @@ def test_denoise_tv_bregman_3d_multichannel_deprecation():
 
 def test_denoise_tv_bregman_max_iter_deprecation():
     with expected_warnings(["`max_iter` is a deprecated argument"]):
-        restoration.denoise_tv_bregman(astro_gray, weight=60.0, max_iter=5)
+        # copy, as the Cython kernel does not accept read-only input
+        restoration.denoise_tv_bregman(astro_gray.copy(), weight=60.0,
+                                       max_iter=5)
 
 
 def test_denoise_tv_bregman_multichannel():
-    img = checkerboard_gray.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard_gray_crop', 0.5).copy()
 
     out1 = restoration.denoise_tv_bregman(img, weight=60.0)
     out2 = restoration.denoise_tv_bregman(img, weight=60.0, channel_axis=-1)
@@ -288,15 +371,10 @@ def test_denoise_bilateral_negative2():
 
 
 def test_denoise_bilateral_2d():
-    img = checkerboard_gray.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard_gray_crop', 0.5).copy()
 
-    out1 = restoration.denoise_bilateral(img, sigma_color=0.1,
-                                         sigma_spatial=10, channel_axis=None)
-    out2 = restoration.denoise_bilateral(img, sigma_color=0.2,
-                                         sigma_spatial=20, channel_axis=None)
+    out1, out2 = _denoise_bilateral_batch(img, [(0.1, 10), (0.2, 20)],
+                                          channel_axis=None)
 
     # make sure noise is reduced in the checkerboard cells
     assert img[30:45, 5:15].std() > out1[30:45, 5:15].std()
@@ -318,10 +396,7 @@ def test_denoise_bilateral_pad():
 
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_denoise_bilateral_types(dtype):
-    img = checkerboard_gray.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1).astype(dtype)
+    img = _noisy('checkerboard_gray_crop', 0.5).astype(dtype)
 
     # check that we can process multiple float types
     restoration.denoise_bilateral(img, sigma_color=0.1,
@@ -330,10 +405,7 @@ def test_denoise_bilateral_types(dtype):
 
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_denoise_bregman_types(dtype):
-    img = checkerboard_gray.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1).astype(dtype)
+    img = _noisy('checkerboard_gray_crop', 0.5).astype(dtype)
 
     # check that we can process multiple float types
     restoration.denoise_tv_bregman(img, weight=5)
@@ -353,18 +425,11 @@ def test_denoise_bilateral_constant():
 
 @pytest.mark.parametrize('channel_axis', [0, 1, -1])
 def test_denoise_bilateral_color(channel_axis):
-    img = checkerboard.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard_crop', 0.5).copy()
 
     img = np.moveaxis(img, -1, channel_axis)
-    out1 = restoration.denoise_bilateral(img, sigma_color=0.1,
-                                         sigma_spatial=10,
-                                         channel_axis=channel_axis)
-    out2 = restoration.denoise_bilateral(img, sigma_color=0.2,
-                                         sigma_spatial=20,
-                                         channel_axis=channel_axis)
+    out1, out2 = _denoise_bilateral_batch(img, [(0.1, 10), (0.2, 20)],
+                                          channel_axis=channel_axis)
     img = np.moveaxis(img, channel_axis, -1)
     out1 = np.moveaxis(out1, channel_axis, -1)
     out2 = np.moveaxis(out2, channel_axis, -1)
@@ -374,11 +439,27 @@ def test_denoise_bilateral_color(channel_axis):
     assert out1[30:45, 5:15].std() > out2[30:45, 5:15].std()
 
 
+@pytest.mark.parametrize('channel_axis', [None, 0, -1])
+def test_denoise_bilateral_batch(channel_axis):
+    if channel_axis is None:
+        img = _noisy('checkerboard_gray_crop', 0.5).copy()
+    else:
+        img = _noisy('checkerboard_crop', 0.5).copy()
+        img = np.moveaxis(img, -1, channel_axis)
+
+    # repeated and default sigmas share lookup tables within the batch
+    params = [(0.1, 3), (None, 2), (0.1, 3)]
+    outs = _denoise_bilateral_batch(img, params, channel_axis=channel_axis)
+    assert len(outs) == len(params)
+    for (sigma_color, sigma_spatial), out in zip(params, outs):
+        expected = restoration.denoise_bilateral(
+            img, sigma_color=sigma_color, sigma_spatial=sigma_spatial,
+            channel_axis=channel_axis)
+        assert_array_equal(out, expected)
+
+
 def test_denoise_bilateral_multichannel_deprecation():
-    img = checkerboard.copy()[:50, :50]
-    # add some random noise
-    img += 0.5 * img.std() * np.random.rand(*img.shape)
-    img = np.clip(img, 0, 1)
+    img = _noisy('checkerboard_crop', 0.5).copy()
 
     with expected_warnings(["`multichannel` is a deprecated argument"]):
         out1 = restoration.denoise_bilateral(img, sigma_color=0.1,
@@ -430,7 +511,7 @@ def test_denoise_nl_means_2d(fast_mode):
     img = np.zeros((40, 40))
     img[10:-10, 10:-10] = 1.
     sigma = 0.3
-    img += sigma * np.random.standard_normal(img.shape)
+    img += sigma * _noise(img.shape)
     img_f32 = img.astype('float32')
     for s in [sigma, 0]:
         denoised = restoration.denoise_nl_means(img, 7, 5, 0.2,
@@ -448,7 +529,7 @@ def test_denoise_nl_means_2d(fast_mode):
         assert img.std() > denoised_f32.std()
 
         # Check single precision result
-        assert np.allclose(denoised_f32, denoised, atol=1e-2)
+        assert_allclose(denoised_f32, denoised, rtol=0, atol=1e-2)
 
 
 @pytest.mark.parametrize('fast_mode', [False, True])
@@ -456,19 +537,19 @@ def test_denoise_nl_means_2d(fast_mode):
 @pytest.mark.parametrize('dtype', ['float64', 'float32'])
 def test_denoise_nl_means_2d_multichannel(fast_mode, n_channels, dtype):
     # reduce image size because nl means is slow
-    img = np.copy(astro[:50, :50])
+    img = astro[:50, :50]
     img = np.concatenate((img, ) * 2, )  # 6 channels
     img = img.astype(dtype)
 
     # add some random noise
     sigma = 0.1
-    imgn = img + sigma * np.random.standard_normal(img.shape)
+    imgn = img + sigma * _noise(img.shape)
     imgn = np.clip(imgn, 0, 1)
     imgn = imgn.astype(dtype)
 
+    psnr_noisy = peak_signal_noise_ratio(
+        img[..., :n_channels], imgn[..., :n_channels])
     for s in [sigma, 0]:
-        psnr_noisy = peak_signal_noise_ratio(
-            img[..., :n_channels], imgn[..., :n_channels])
         denoised = restoration.denoise_nl_means(imgn[..., :n_channels],
                                                 3, 5, h=0.75 * sigma,
                                                 fast_mode=fast_mode,
@@ -483,11 +564,11 @@ def test_denoise_nl_means_2d_multichannel(fast_mode, n_channels, dtype):
 
 def test_denoise_nl_means_2d_multichannel_deprecated():
     # reduce image size because nl means is slow
-    img = np.copy(astro[:50, :50])
+    img = astro[:50, :50]
 
     # add some random noise
     sigma = 0.1
-    imgn = img + sigma * np.random.standard_normal(img.shape)
+    imgn = img + sigma * _noise(img.shape)
     imgn = np.clip(imgn, 0, 1)
 
     psnr_noisy = peak_signal_noise_ratio(img, imgn)
@@ -513,7 +594,7 @@ def test_denoise_nl_means_3d(fast_mode, dtype):
     img = np.zeros((12, 12, 8), dtype=dtype)
     img[5:-5, 5:-5, 2:-2] = 1.
     sigma = 0.3
-    imgn = img + sigma * np.random.standard_normal(img.shape)
+    imgn = img + sigma * _noise(img.shape)
     imgn = imgn.astype(dtype)
     psnr_noisy = peak_signal_noise_ratio(img, imgn)
     for s in [sigma, 0]:
@@ -541,13 +622,13 @@ def test_denoise_nl_means_multichannel(fast_mode, dtype, channel_axis):
 
     # test 3D denoising (channel_axis = None)
     denoised_ok_multichannel = restoration.denoise_nl_means(
-        imgn.copy(), 3, 2, h=0.6 * sigma, sigma=sigma, fast_mode=fast_mode,
+        imgn, 3, 2, h=0.6 * sigma, sigma=sigma, fast_mode=fast_mode,
         channel_axis=None)
 
     # set a channel axis: one dimension is (incorrectly) considered "channels"
     imgn = np.moveaxis(imgn, -1, channel_axis)
     denoised_wrong_multichannel = restoration.denoise_nl_means(
-        imgn.copy(), 3, 2, h=0.6 * sigma, sigma=sigma, fast_mode=fast_mode,
+        imgn, 3, 2, h=0.6 * sigma, sigma=sigma, fast_mode=fast_mode,
         channel_axis=channel_axis
     )
     denoised_wrong_multichannel = np.moveaxis(
@@ -602,7 +683,7 @@ def test_denoise_nl_means_4d_multichannel():
     img = np.zeros((8, 8, 8, 4, 4))
     img[2:-2, 2:-2, 2:-2, 1:-1, :] = 1.
     sigma = 0.3
-    imgn = img + sigma * np.random.randn(*img.shape)
+    imgn = img + sigma * _noise(img.shape)
 
     psnr_noisy = peak_signal_noise_ratio(img, imgn, data_range=1.)
 
@@ -650,17 +731,18 @@ def test_denoise_nl_means_wrong_dimension():
 def test_no_denoising_for_small_h(fast_mode, dtype):
     img = np.zeros((40, 40))
     img[10:-10, 10:-10] = 1.
-    img += 0.3 * np.random.standard_normal(img.shape)
+    img += 0.3 * _noise(img.shape)
     img = img.astype(dtype)
+    atol = 1e-6 if dtype == 'float32' else 1e-8
     # very small h should result in no averaging with other patches
     denoised = restoration.denoise_nl_means(img, 7, 5, 0.01,
                                             fast_mode=fast_mode,
                                             channel_axis=None)
-    assert np.allclose(denoised, img)
+    assert_allclose(denoised, img, rtol=0, atol=atol)
     denoised = restoration.denoise_nl_means(img, 7, 5, 0.01,
                                             fast_mode=fast_mode,
                                             channel_axis=None)
-    assert np.allclose(denoised, img)
+    assert_allclose(denoised, img, rtol=0, atol=atol)
 
 
 @pytest.mark.parametrize('fast_mode', [False, True])
@@ -702,20 +784,19 @@ def test_denoise_nl_means_3d_dtype(fast_mode):
      (astro_odd, True, False),
      (astro_odd, True, True)]
 )
-def test_wavelet_denoising(img, multichannel, convert2ycbcr):
-    rstate = np.random.default_rng(1234)
+def test_wavelet_denoising(img, multichannel, convert2ycbcr, rstate):
     sigma = 0.1
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
     channel_axis = -1 if multichannel else None
+    psnr_noisy = peak_signal_noise_ratio(img, noisy)
 
     # Verify that SNR is improved when true sigma is used
     denoised = restoration.denoise_wavelet(noisy, sigma=sigma,
                                            channel_axis=channel_axis,
                                            convert2ycbcr=convert2ycbcr,
                                            rescale_sigma=True)
-    psnr_noisy = peak_signal_noise_ratio(img, noisy)
     psnr_denoised = peak_signal_noise_ratio(img, denoised)
     assert psnr_denoised > psnr_noisy
 
@@ -724,7 +805,6 @@ def test_wavelet_denoising(img, multichannel, convert2ycbcr):
                                            channel_axis=channel_axis,
                                            convert2ycbcr=convert2ycbcr,
                                            rescale_sigma=True)
-    psnr_noisy = peak_signal_noise_ratio(img, noisy)
     psnr_denoised = peak_signal_noise_ratio(img, denoised)
     assert psnr_denoised > psnr_noisy
 
@@ -739,22 +819,38 @@ def test_wavelet_denoising(img, multichannel, convert2ycbcr):
     assert psnr_denoised_1 > psnr_noisy
 
     # Test changing noise_std (higher threshold, so less energy in signal)
-    res1 = restoration.denoise_wavelet(noisy, sigma=2 * sigma,
-                                       channel_axis=channel_axis,
-                                       rescale_sigma=True)
-    res2 = restoration.denoise_wavelet(noisy, sigma=sigma,
-                                       channel_axis=channel_axis,
-                                       rescale_sigma=True)
-    assert np.sum(res1**2) <= np.sum(res2**2)
+    if convert2ycbcr:
+        res1 = restoration.denoise_wavelet(noisy, sigma=2 * sigma,
+                                           channel_axis=channel_axis,
+                                           convert2ycbcr=convert2ycbcr,
+                                           rescale_sigma=True)
+        res2 = restoration.denoise_wavelet(noisy, sigma=sigma,
+                                           channel_axis=channel_axis,
+                                           convert2ycbcr=convert2ycbcr,
+                                           rescale_sigma=True)
+        assert np.sum(res1**2) <= np.sum(res2**2)
+        return
+
+    # Without the color conversion, both thresholds are applied to a single
+    # decomposition of each channel.
+    channels = np.moveaxis(noisy, -1, 0) if multichannel else [noisy]
+    for channel in channels:
+        levels = _default_wavelet_levels(channel.shape, 'db1')
+        coeffs = pywt.wavedecn(channel, 'db1', level=levels)
+        res1 = _wavelet_threshold_coeffs(coeffs, channel.shape, 'db1',
+                                         method='BayesShrink',
+                                         sigma=2 * sigma)
+        res2 = _wavelet_threshold_coeffs(coeffs, channel.shape, 'db1',
+                                         method='BayesShrink', sigma=sigma)
+        assert np.sum(res1**2) <= np.sum(res2**2)
 
 
 @pytest.mark.parametrize('channel_axis', [0, 1, 2, -1])
 @pytest.mark.parametrize('convert2ycbcr', [False, True])
-def test_wavelet_denoising_channel_axis(channel_axis, convert2ycbcr):
-    rstate = np.random.default_rng(1234)
+def test_wavelet_denoising_channel_axis(channel_axis, convert2ycbcr, rstate):
     sigma = 0.1
     img = astro_odd
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
     img = np.moveaxis(img, -1, channel_axis)
@@ -769,12 +865,46 @@ def test_wavelet_denoising_channel_axis(channel_axis, convert2ycbcr):
     psnr_denoised = peak_signal_noise_ratio(img, denoised)
     assert psnr_denoised > psnr_noisy
 
+    # the result can be written to a preallocated array
+    out = np.empty_like(noisy)
+    result = restoration.denoise_wavelet(noisy, sigma=sigma,
+                                         channel_axis=channel_axis,
+                                         convert2ycbcr=convert2ycbcr,
+                                         rescale_sigma=True, out=out)
+    assert result is out
+    assert_array_equal(out, denoised)
 
-def test_wavelet_denoising_deprecated():
-    rstate = np.random.default_rng(1234)
+
+def test_wavelet_denoising_out_shape():
+    with pytest.raises(ValueError):
+        restoration.denoise_wavelet(astro_gray, out=np.empty((3, 3)))
+
+
+@pytest.mark.parametrize('dtype, out_dtype',
+                         [(np.float16, np.float16), (np.float32, np.float64),
+                          (np.float64, np.float32), (np.uint8, np.uint8)])
+def test_wavelet_denoising_out_dtype(dtype, out_dtype):
+    # out is not allowed to silently cast the result
+    img = np.zeros((8, 8), dtype=dtype)
+    with pytest.raises(ValueError, match='dtype'):
+        restoration.denoise_wavelet(img, out=np.empty(img.shape, out_dtype))
+
+
+@pytest.mark.parametrize('dtype', [np.float16, np.float32, np.float64,
+                                   np.uint8])
+def test_wavelet_denoising_out_result_dtype(dtype):
+    img = (astro_gray[:32, :32] * 100).astype(dtype)
+    expected = restoration.denoise_wavelet(img)
+    out = np.empty(img.shape, dtype=_supported_float_type(dtype))
+    result = restoration.denoise_wavelet(img, out=out)
+    assert result is out
+    assert_array_equal(out, expected)
+
+
+def test_wavelet_denoising_deprecated(rstate):
     sigma = 0.1
     img = astro_odd
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
     with expected_warnings(["`multichannel` is a deprecated argument"]):
@@ -792,17 +922,14 @@ def test_wavelet_denoising_deprecated():
                                     rescale_sigma=True)
 
 
-@pytest.mark.parametrize(
-    'case, dtype, convert2ycbcr, estimate_sigma',
-    itertools.product(
-        ['1d', '2d multichannel'],
-        [np.float16, np.float32, np.float64, np.int16, np.uint8],
-        [True, False],
-        [True, False])
-)
-def test_wavelet_denoising_scaling(case, dtype, convert2ycbcr,
-                                   estimate_sigma):
-    """Test cases for images without prescaling via img_as_float."""
+@functools.lru_cache(maxsize=None)
+def _scaling_input(case, dtype):
+    """Signal, noisy signal and estimated sigma for a scaling test case.
+
+    The noise is generated only once per ``(case, dtype)`` pair and shared by
+    all parametrizations of ``test_wavelet_denoising_scaling``, so the
+    returned arrays are read-only.
+    """
     rstate = np.random.default_rng(1234)
 
     if case == '1d':
@@ -815,16 +942,51 @@ def test_wavelet_denoising_scaling(case, dtype, convert2ycbcr,
 
     # add noise and clip to original signal range
     sigma = 25.
-    noisy = x + sigma * rstate.standard_normal(x.shape)
+    noisy = _add_noise(x, sigma, rstate)
     noisy = np.clip(noisy, x.min(), x.max())
     noisy = noisy.astype(x.dtype)
 
     channel_axis = -1 if x.shape[-1] == 3 else None
+    sigma_est = restoration.estimate_sigma(noisy, channel_axis=channel_axis)
+    if channel_axis is not None:
+        sigma_est = tuple(sigma_est)
 
-    if estimate_sigma:
-        sigma_est = restoration.estimate_sigma(noisy,
-                                               channel_axis=channel_axis)
-    else:
+    x.setflags(write=False)
+    noisy.setflags(write=False)
+    return x, noisy, channel_axis, sigma_est
+
+
+def _scaling_params():
+    """Parameters of `test_wavelet_denoising_scaling`, with readable ids.
+
+    The ids are stable across runs, so the cases can be distributed between
+    workers (e.g. ``pytest -n auto`` with pytest-xdist).
+    """
+    for case, dtype, convert2ycbcr, estimate_sigma in itertools.product(
+            ['1d', '2d multichannel'],
+            [np.float16, np.float32, np.float64, np.int16, np.uint8],
+            [True, False],
+            [True, False]):
+        test_id = '-'.join([
+            case.replace(' ', '_'),
+            np.dtype(dtype).name,
+            'ycbcr' if convert2ycbcr else 'no_ycbcr',
+            'estimated_sigma' if estimate_sigma else 'known_sigma',
+        ])
+        # float16 is promoted to float32 before denoising, so these cases
+        # only add coverage of that promotion
+        marks = pytest.mark.slow if dtype is np.float16 else ()
+        yield pytest.param(case, dtype, convert2ycbcr, estimate_sigma,
+                           id=test_id, marks=marks)
+
+
+@pytest.mark.parametrize('case, dtype, convert2ycbcr, estimate_sigma',
+                         list(_scaling_params()))
+def test_wavelet_denoising_scaling(case, dtype, convert2ycbcr,
+                                   estimate_sigma):
+    """Test cases for images without prescaling via img_as_float."""
+    x, noisy, channel_axis, sigma_est = _scaling_input(case, dtype)
+    if not estimate_sigma:
         sigma_est = None
 
     if convert2ycbcr and channel_axis is None:
@@ -871,12 +1033,11 @@ def test_wavelet_denoising_scaling(case, dtype, convert2ycbcr,
     assert psnr_denoised > psnr_noisy
 
 
-def test_wavelet_threshold():
-    rstate = np.random.default_rng(1234)
+def test_wavelet_threshold(rstate):
 
     img = astro_gray
     sigma = 0.1
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
     # employ a single, user-specified threshold instead of BayesShrink sigmas
@@ -896,15 +1057,9 @@ def test_wavelet_threshold():
                            threshold=sigma)
 
 
-@pytest.mark.parametrize(
-    'rescale_sigma, method, ndim',
-    itertools.product(
-        [True, False],
-        ['VisuShrink', 'BayesShrink'],
-        range(1, 5)
-    )
-)
-def test_wavelet_denoising_nd(rescale_sigma, method, ndim):
+@functools.lru_cache(maxsize=None)
+def _nd_input(ndim):
+    """Simple test image and its (read-only) noisy version for each ndim."""
     rstate = np.random.default_rng(1234)
     # Generate a very simple test image
     if ndim < 3:
@@ -914,9 +1069,31 @@ def test_wavelet_denoising_nd(rescale_sigma, method, ndim):
     img[(slice(5, 13), ) * ndim] = 0.8
 
     sigma = 0.1
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
+    img.setflags(write=False)
+    noisy.setflags(write=False)
+    return img, noisy
+
+
+@functools.lru_cache(maxsize=None)
+def _nd_output(ndim):
+    """Output array reused by all denoising calls on ``_nd_input(ndim)``."""
+    return np.empty_like(_nd_input(ndim)[1])
+
+
+@pytest.mark.parametrize(
+    'rescale_sigma, method, ndim',
+    itertools.product(
+        [True, False],
+        ['VisuShrink', 'BayesShrink'],
+        range(1, 5)
+    )
+)
+def test_wavelet_denoising_nd(rescale_sigma, method, ndim):
+    img, noisy = _nd_input(ndim)
+
     # Mark H. 2018.08:
     #   The issue arises because when ndim in [1, 2]
     #   ``waverecn`` calls ``_match_coeff_dims``
@@ -924,9 +1101,11 @@ def test_wavelet_denoising_nd(rescale_sigma, method, ndim):
     #   for larger number of dimensions _match_coeff_dims isn't called
     #   for some reason.
     # Verify that SNR is improved with internally estimated sigma
+    out = _nd_output(ndim)
     denoised = restoration.denoise_wavelet(
         noisy, method=method,
-        rescale_sigma=rescale_sigma)
+        rescale_sigma=rescale_sigma, out=out)
+    assert denoised is out
     psnr_noisy = peak_signal_noise_ratio(img, noisy)
     psnr_denoised = peak_signal_noise_ratio(img, denoised)
     assert psnr_denoised > psnr_noisy
@@ -938,9 +1117,14 @@ def test_wavelet_invalid_method():
                                     rescale_sigma=True)
 
 
+@functools.lru_cache(maxsize=None)
+def _max_level(shape_min, wavelet):
+    """Maximum useful decomposition level for a signal of length shape_min."""
+    return pywt.dwt_max_level(shape_min, pywt.Wavelet(wavelet).dec_len)
+
+
 @pytest.mark.parametrize('rescale_sigma', [True, False])
-def test_wavelet_denoising_levels(rescale_sigma):
-    rstate = np.random.default_rng(1234)
+def test_wavelet_denoising_levels(rescale_sigma, rstate):
     ndim = 2
     N = 256
     wavelet = 'db1'
@@ -949,7 +1133,7 @@ def test_wavelet_denoising_levels(rescale_sigma):
     img[(slice(5, 13), ) * ndim] = 0.8
 
     sigma = 0.1
-    noisy = img + sigma * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, sigma, rstate)
     noisy = np.clip(noisy, 0, 1)
 
     denoised = restoration.denoise_wavelet(noisy, wavelet=wavelet,
@@ -965,8 +1149,7 @@ def test_wavelet_denoising_levels(rescale_sigma):
     assert psnr_denoised > psnr_denoised_1 > psnr_noisy
 
     # invalid number of wavelet levels results in a ValueError or UserWarning
-    max_level = pywt.dwt_max_level(np.min(img.shape),
-                                   pywt.Wavelet(wavelet).dec_len)
+    max_level = _max_level(min(img.shape), wavelet)
     # exceeding max_level raises a UserWarning in PyWavelets >= 1.0.0
     with expected_warnings([
             'all coefficients will experience boundary effects']):
@@ -981,23 +1164,19 @@ def test_wavelet_denoising_levels(rescale_sigma):
             rescale_sigma=rescale_sigma)
 
 
-def test_estimate_sigma_gray():
-    rstate = np.random.default_rng(1234)
-    # astronaut image
-    img = astro_gray.copy()
+def test_estimate_sigma_gray(rstate):
     sigma = 0.1
-    # add noise to astronaut
-    img += sigma * rstate.standard_normal(img.shape)
+    # add noise to astronaut image
+    img = _add_noise(astro_gray, sigma, rstate)
 
     sigma_est = restoration.estimate_sigma(img, channel_axis=None)
     assert_array_almost_equal(sigma, sigma_est, decimal=2)
 
 
-def test_estimate_sigma_masked_image():
+def test_estimate_sigma_masked_image(rstate):
     # Verify computation on an image with a large, noise-free border.
     # (zero regions will be masked out by _sigma_est_dwt to avoid returning
     #  sigma = 0)
-    rstate = np.random.default_rng(1234)
     # uniform image
     img = np.zeros((128, 128))
     center_roi = (slice(32, 96), slice(32, 96))
@@ -1011,13 +1190,10 @@ def test_estimate_sigma_masked_image():
 
 
 @pytest.mark.parametrize('channel_axis', [0, 1, 2, -1])
-def test_estimate_sigma_color(channel_axis):
-    rstate = np.random.default_rng(1234)
-    # astronaut image
-    img = astro.copy()
+def test_estimate_sigma_color(channel_axis, rstate):
     sigma = 0.1
-    # add noise to astronaut
-    img += sigma * rstate.standard_normal(img.shape)
+    # add noise to astronaut image
+    img = _add_noise(astro, sigma, rstate)
     img = np.moveaxis(img, -1, channel_axis)
 
     sigma_est = restoration.estimate_sigma(img, channel_axis=channel_axis,
@@ -1034,13 +1210,10 @@ def test_estimate_sigma_color(channel_axis):
         assert_warns(UserWarning, restoration.estimate_sigma, img)
 
 
-def test_estimate_sigma_color_deprecated_multichannel():
-    rstate = np.random.default_rng(1234)
-    # astronaut image
-    img = astro.copy()
+def test_estimate_sigma_color_deprecated_multichannel(rstate):
     sigma = 0.1
-    # add noise to astronaut
-    img += sigma * rstate.standard_normal(img.shape)
+    # add noise to astronaut image
+    img = _add_noise(astro, sigma, rstate)
 
     with expected_warnings(["`multichannel` is a deprecated argument"]):
         sigma_est = restoration.estimate_sigma(img, multichannel=True,
@@ -1061,7 +1234,7 @@ def test_wavelet_denoising_args(rescale_sigma):
     arguments can be passed.
     """
     img = astro
-    noisy = img.copy() + 0.1 * np.random.standard_normal(img.shape)
+    noisy = img + 0.1 * _noise(img.shape)
 
     for convert2ycbcr in [True, False]:
         for multichannel in [True, False]:
@@ -1092,65 +1265,94 @@ def test_denoise_wavelet_biorthogonal(rescale_sigma):
                  rescale_sigma=rescale_sigma)
 
 
+@functools.lru_cache(maxsize=None)
+def _cycle_spin_input(multichannel):
+    """Single precision test image and its (read-only) noisy version.
+
+    Computed once and shared by all cycle spinning tests. The grayscale
+    images are derived from the RGB ones, so both use the same noise.
+    """
+    if not multichannel:
+        img, noisy = _cycle_spin_input(True)
+        img, noisy = color.rgb2gray(img), color.rgb2gray(noisy)
+    else:
+        rstate = np.random.default_rng(1234)
+        # PSNR comparisons do not need many pixels, so downsample
+        img = astro[::2, ::2].astype(np.float32)
+        noisy = rstate.standard_normal(img.shape, dtype=np.float32)
+        noisy *= 0.1
+        noisy += img
+
+    img.setflags(write=False)
+    noisy.setflags(write=False)
+    return img, noisy
+
+
+def _memoized_denoise_wavelet(cache, x, **kwargs):
+    """`denoise_wavelet`, with the result cached by input content and kwargs.
+
+    The parametrized cycle spinning tests denoise many of the same shifted
+    images (the unshifted one in every case), so each is denoised only once.
+    The returned arrays are read-only.
+    """
+    key = (x.shape, x.dtype.str, x.tobytes(), tuple(sorted(kwargs.items())))
+    if key not in cache:
+        denoised = restoration.denoise_wavelet(x, **kwargs)
+        denoised.setflags(write=False)
+        cache[key] = denoised
+    return cache[key]
+
+
+@pytest.fixture(scope='module')
+def memoized_denoise_wavelet():
+    """`_memoized_denoise_wavelet` with a cache that lives for this module."""
+    cache = {}
+    yield functools.partial(_memoized_denoise_wavelet, cache)
+    cache.clear()
+
+
+def _cycle_spin_reference(denoise_func, channel_axis, rescale_sigma):
+    """Wavelet denoising of the cycle spinning input without any shifts."""
+    _, noisy = _cycle_spin_input(channel_axis is not None)
+    return denoise_func(noisy, sigma=0.1, channel_axis=channel_axis,
+                        rescale_sigma=rescale_sigma)
+
+
+@pytest.fixture(scope='module')
+def pool():
+    """Thread pool shared by the cycle spinning tests."""
+    with ThreadPoolExecutor() as executor:
+        yield executor
+
+
 @pytest.mark.parametrize('channel_axis', [-1, None])
 @pytest.mark.parametrize('rescale_sigma', [True, False])
-def test_cycle_spinning_multichannel(rescale_sigma, channel_axis):
-    sigma = 0.1
-    rstate = np.random.default_rng(1234)
+def test_cycle_spinning_multichannel(rescale_sigma, channel_axis,
+                                     memoized_denoise_wavelet):
+    _, noisy = _cycle_spin_input(channel_axis is not None)
 
     if channel_axis is not None:
-        img = astro
-        # can either omit or be 0 along the channels axis
-        valid_shifts = [1, (0, 1), (1, 0), (1, 1), (1, 1, 0)]
-        # can either omit or be 1 on channels axis.
-        valid_steps = [1, 2, (1, 2), (1, 2, 1)]
-        # too few or too many shifts or non-zero shift on channels
-        invalid_shifts = [(1, 1, 2), (1, ), (1, 1, 0, 1)]
+        # too few or too many shifts, negative shifts or non-zero shift on
+        # channels
+        invalid_shifts = [(1, 1, 2), (1, ), (1, 1, 0, 1), (-1, 1)]
         # too few or too many shifts or any shifts <= 0
         invalid_steps = [(1, ), (1, 1, 1, 1), (0, 1), (-1, -1)]
     else:
-        img = astro_gray
-        valid_shifts = [1, (0, 1), (1, 0), (1, 1)]
-        valid_steps = [1, 2, (1, 2)]
-        invalid_shifts = [(1, 1, 2), (1, )]
+        invalid_shifts = [(1, 1, 2), (1, ), (-1, 1)]
         invalid_steps = [(1, ), (1, 1, 1), (0, 1), (-1, -1)]
 
-    noisy = img.copy() + 0.1 * rstate.standard_normal(img.shape)
-
     denoise_func = restoration.denoise_wavelet
-    func_kw = dict(sigma=sigma, channel_axis=channel_axis,
+    func_kw = dict(sigma=0.1, channel_axis=channel_axis,
                    rescale_sigma=rescale_sigma)
 
-    # max_shifts=0 is equivalent to just calling denoise_func
-    with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-        dn_cc = restoration.cycle_spin(noisy, denoise_func, max_shifts=0,
-                                       func_kw=func_kw,
-                                       channel_axis=channel_axis)
-        dn = denoise_func(noisy, **func_kw)
+    # max_shifts=0 is equivalent to just calling denoise_func (and needs no
+    # workers, so there is no warning about dask)
+    dn_cc = restoration.cycle_spin(noisy, denoise_func, max_shifts=0,
+                                   func_kw=func_kw, channel_axis=channel_axis)
+    dn = _cycle_spin_reference(memoized_denoise_wavelet, channel_axis,
+                               rescale_sigma)
     assert_array_equal(dn, dn_cc)
 
-    # denoising with cycle spinning will give better PSNR than without
-    for max_shifts in valid_shifts:
-        with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-            dn_cc = restoration.cycle_spin(noisy, denoise_func,
-                                           max_shifts=max_shifts,
-                                           func_kw=func_kw,
-                                           channel_axis=channel_axis)
-        psnr = peak_signal_noise_ratio(img, dn)
-        psnr_cc = peak_signal_noise_ratio(img, dn_cc)
-        assert psnr_cc > psnr
-
-    for shift_steps in valid_steps:
-        with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-            dn_cc = restoration.cycle_spin(noisy, denoise_func,
-                                           max_shifts=2,
-                                           shift_steps=shift_steps,
-                                           func_kw=func_kw,
-                                           channel_axis=channel_axis)
-        psnr = peak_signal_noise_ratio(img, dn)
-        psnr_cc = peak_signal_noise_ratio(img, dn_cc)
-        assert psnr_cc > psnr
-
     for max_shifts in invalid_shifts:
         with pytest.raises(ValueError):
             dn_cc = restoration.cycle_spin(noisy, denoise_func,
@@ -1166,11 +1368,80 @@ def test_cycle_spinning_multichannel(rescale_sigma, channel_axis):
                                            channel_axis=channel_axis)
 
 
-def test_cycle_spinning_num_workers():
+@pytest.mark.parametrize(
+    'channel_axis, max_shifts, shift_steps',
+    # along the channels axis, shifts can either be omitted or be 0
+    [(-1, max_shifts, 1)
+     for max_shifts in [1, (0, 1), (1, 0), (1, 1), (1, 1, 0)]]
+    # along the channels axis, steps can either be omitted or be 1
+    + [(-1, 2, shift_steps) for shift_steps in [1, 2, (1, 2), (1, 2, 1)]]
+    + [(None, max_shifts, 1) for max_shifts in [1, (0, 1), (1, 0), (1, 1)]]
+    + [(None, 2, shift_steps) for shift_steps in [1, 2, (1, 2)]],
+    ids=str
+)
+@pytest.mark.parametrize('rescale_sigma', [True, False])
+def test_cycle_spinning_psnr(rescale_sigma, channel_axis, max_shifts,
+                             shift_steps, pool, memoized_denoise_wavelet):
+    img, noisy = _cycle_spin_input(channel_axis is not None)
+    func_kw = dict(sigma=0.1, channel_axis=channel_axis,
+                   rescale_sigma=rescale_sigma)
+
+    # denoising with cycle spinning will give better PSNR (i.e. lower mean
+    # squared error) than without
+    dn = _cycle_spin_reference(memoized_denoise_wavelet, channel_axis,
+                               rescale_sigma)
+    dn_cc = restoration.cycle_spin(noisy, memoized_denoise_wavelet,
+                                   max_shifts=max_shifts,
+                                   shift_steps=shift_steps,
+                                   func_kw=func_kw,
+                                   channel_axis=channel_axis,
+                                   pool=pool)
+    assert _mse(img, dn_cc) < _mse(img, dn)
+
+
+@pytest.mark.slow
+def test_cycle_spinning_full_resolution(pool, rstate):
+    # the other cycle spinning tests use a small, downsampled image
+    img = img_as_float(data.astronaut())
+    noisy = _add_noise(img, 0.1, rstate)
+    func_kw = dict(sigma=0.1, channel_axis=-1)
+    dn = restoration.denoise_wavelet(noisy, **func_kw)
+    dn_cc = restoration.cycle_spin(noisy, restoration.denoise_wavelet,
+                                   max_shifts=1, func_kw=func_kw,
+                                   channel_axis=-1, pool=pool)
+    assert _mse(img, dn_cc) < _mse(img, dn)
+
+
+@pytest.mark.parametrize('shift', [(0, 0), (1, 0), (0, -2), (3, 5), (-1, 7),
+                                   (2, 1, 0)])
+def test_roll_into(shift):
+    a = np.arange(4 * 5 * 2).reshape(4, 5, 2)
+    out = np.empty_like(a)
+    _roll_into(a, shift, out)
+    assert_array_equal(out, np.roll(a, shift, axis=tuple(range(len(shift)))))
+
+
+def test_roll_into_zero_length_axis():
+    a = np.empty((0, 4))
+    out = np.empty_like(a)
+    _roll_into(a, (1, 1), out)
+    assert out.shape == (0, 4)
+    dn_cc = restoration.cycle_spin(a, lambda y: y, max_shifts=1,
+                                   num_workers=1)
+    assert dn_cc.shape == (0, 4)
+
+
+def test_cycle_spinning_no_shifts():
+    # with max_shifts=0 the output of func is returned as is
+    x = np.arange(16.).reshape(4, 4)
+    dn_cc = restoration.cycle_spin(x, lambda y: y, max_shifts=0)
+    assert dn_cc is x
+
+
+def test_cycle_spinning_num_workers(rstate):
     img = astro_gray
     sigma = 0.1
-    rstate = np.random.default_rng(1234)
-    noisy = img.copy() + 0.1 * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, 0.1, rstate)
 
     denoise_func = restoration.denoise_wavelet
     func_kw = dict(sigma=sigma, channel_axis=-1, rescale_sigma=True)
@@ -1190,18 +1461,34 @@ def test_cycle_spinning_num_workers():
         dn_cc2 = restoration.cycle_spin(noisy, denoise_func, max_shifts=1,
                                         func_kw=func_kw, channel_axis=None,
                                         num_workers=4)
-        dn_cc3 = restoration.cycle_spin(noisy, denoise_func, max_shifts=1,
+    assert_allclose(dn_cc1, dn_cc2, rtol=1e-12)
+
+    # an executor sums the shifts in the same order as serial processing
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        dn_cc4 = restoration.cycle_spin(noisy, denoise_func, max_shifts=1,
                                         func_kw=func_kw, channel_axis=None,
-                                        num_workers=None)
-    assert_array_almost_equal(dn_cc1, dn_cc2)
-    assert_array_almost_equal(dn_cc1, dn_cc3)
+                                        pool=pool)
+    assert_array_equal(dn_cc1, dn_cc4)
+
+
+def test_cycle_spinning_process_pool(rstate):
+    # the per-shift work must be picklable to run in worker processes
+    noisy = _add_noise(astro_gray[:32, :32], 0.1, rstate)
+    func_kw = dict(sigma=0.1, rescale_sigma=True)
+    dn_cc1 = restoration.cycle_spin(noisy, restoration.denoise_wavelet,
+                                    max_shifts=1, func_kw=func_kw,
+                                    num_workers=1)
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        dn_cc2 = restoration.cycle_spin(noisy, restoration.denoise_wavelet,
+                                        max_shifts=1, func_kw=func_kw,
+                                        pool=pool)
+    assert_array_equal(dn_cc1, dn_cc2)
 
 
-def test_cycle_spinning_num_workers_deprecated_multichannel():
+def test_cycle_spinning_num_workers_deprecated_multichannel(rstate):
     img = astro_gray[:32, :32]
     sigma = 0.1
-    rstate = np.random.default_rng(1234)
-    noisy = img.copy() + 0.1 * rstate.standard_normal(img.shape)
+    noisy = _add_noise(img, 0.1, rstate)
 
     denoise_func = restoration.denoise_wavelet
 
@@ -1215,22 +1502,14 @@ def test_cycle_spinning_num_workers_deprecated_multichannel():
                                         func_kw=func_kw, multichannel=False,
                                         num_workers=1)
 
-    if DASK_NOT_INSTALLED_WARNING is None:
-        exp_warn = [mc_warn_str]
-    else:
-        exp_warn = [mc_warn_str, DASK_NOT_INSTALLED_WARNING]
-    with expected_warnings(exp_warn):
+    # expected_warnings ignores the None entry when dask is installed
+    with expected_warnings([mc_warn_str, DASK_NOT_INSTALLED_WARNING]):
         dn_cc2 = restoration.cycle_spin(noisy, denoise_func, max_shifts=1,
                                         func_kw=func_kw, multichannel=False,
                                         num_workers=2)
-    assert_array_almost_equal(dn_cc1, dn_cc2)
+    assert_allclose(dn_cc1, dn_cc2, rtol=1e-12)
 
     # providing multichannel argument positionally also warns
     mc_warn_str = "Providing the `multichannel` argument"
-    if DASK_NOT_INSTALLED_WARNING is None:
-        exp_warn = [mc_warn_str]
-    else:
-        exp_warn = [mc_warn_str, DASK_NOT_INSTALLED_WARNING]
-
-    with expected_warnings(exp_warn):
+    with expected_warnings([mc_warn_str, DASK_NOT_INSTALLED_WARNING]):
         restoration.cycle_spin(noisy, denoise_func, 1, 1, None, False)